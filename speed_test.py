@@ -5,10 +5,6 @@ import tinyecs as ecs
 import random
 from sys import argv
 
-arg = argv[1] if len(argv) == 2 else 'mixed'
-if arg not in ['perfect', 'imperfect', 'mixed']:
-    arg = "mixed"
-
 WIDTH = 800
 HEIGHT = 800
 ENTITY_AMOUNT = 1_000 * 10
@@ -20,12 +16,16 @@ ENTITY_AMOUNT = 1_000 * 10
 
 
 class Position:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
 
 
 class Velocity:
+    __slots__ = ('vec',)
+
     def __init__(self, vec: list[int | float]) -> None:
         self.vec = vec
 
@@ -64,9 +64,23 @@ def setup(mode):
 
 REPEAT = 1_000
 
-setup(arg)
-res = timeit(lambda: ecs.run_system(1, ball_physics_system, Position, Velocity), number=REPEAT)  # type: ignore
-# res = timeit(lambda: ecs.run1(1, ball_physics_system, Position, Velocity), number=REPEAT)  # type: ignore
-print(
-    f"Took {res/REPEAT} roughly for each frame, using {len(ecs.eidx)} entities, setting: {arg}"
-)
+
+def main(mode):
+    """Run the benchmark for `mode` and return the time per frame."""
+    ecs.reset()
+    setup(mode)
+    runner = ecs.bind_system(ball_physics_system, Position, Velocity)
+    res = timeit(lambda: runner(1), number=REPEAT)  # type: ignore
+    # res = timeit(lambda: ecs.run1(1, ball_physics_system, Position, Velocity), number=REPEAT)  # type: ignore
+    print(
+        f"Took {res/REPEAT} roughly for each frame, using {len(ecs.eidx)} entities, setting: {mode}"
+    )
+    return res / REPEAT
+
+
+if __name__ == '__main__':
+    arg = argv[1] if len(argv) == 2 else 'mixed'
+    if arg not in ['perfect', 'imperfect', 'mixed']:
+        arg = "mixed"
+
+    main(arg)
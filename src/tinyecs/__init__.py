@@ -31,14 +31,26 @@ use comps_of_eid(eid, *comps) for that.  This way, a bullet component can
 substract health from a player entity.
 """
 
-from uuid import uuid4
+from itertools import count
 
 eidx = {}  # entity index
 cidx = {}  # component id index
 sidx = {}  # system index
 didx = {}  # domain index
 oidx = {}  # object index
+aidx = {}  # archetype index
 archetype = {}
+signature = {}  # archetype -> frozenset of its cids
+sigidx = {}  # frozenset of cids -> archetypes with that signature
+# Postponed entity removals.  A dict used as ordered set, so entities killed
+# again before the reap are only queued once.
+kill_list = {}
+
+# Maintain oidx on every add/remove_component.  Set to False if you don't
+# use `eid_of_comp`, which then falls back to searching the registry.
+track_comp_identity = True
+
+_eid_counter = count(1)
 
 
 class UnknownEntityError(KeyError):
@@ -78,7 +90,11 @@ def reset():
     sidx.clear()
     didx.clear()
     oidx.clear()
+    aidx.clear()
     archetype.clear()
+    signature.clear()
+    sigidx.clear()
+    kill_list.clear()
 
 
 def healthcheck():
@@ -127,12 +143,25 @@ def create_entity(tag=None, components=None):
 
     Arguments:
         tag         an optional ID for the entity, e.g. "player"
-                    if no tag is passed, a uuid is generated
+                    if no tag is passed, a unique int is generated
 
         **kwargs	A list of component-IDs and components
 
+    If `tag` is already registered, that entity is removed first, so e.g.
+    re-creating the 'player' on a level restart starts from scratch.  Note
+    that generated eids are ints, so int tags can collide with them.
     """
-    eid = tag if tag else str(uuid4())
+    if tag is not None:
+        # Tear the old one down properly, so no stale components are left
+        # behind in cidx and the archetypes.
+        remove_entity(tag)
+        eid = tag
+    else:
+        # ints hash to themselves, which is much cheaper than a uuid string on
+        # every lookup.  Skip numbers the user already used as a tag.
+        eid = next(_eid_counter)
+        while eid in eidx:
+            eid = next(_eid_counter)
     eidx[eid] = {}
 
     # Add optionally passed components
@@ -142,7 +171,7 @@ def create_entity(tag=None, components=None):
     return eid
 
 
-def remove_entity(eid):
+def remove_entity(eid, postponed=False):
     """Remove an entity from the system
 
         remove_entity(entity_id, postponed=False) -> None
@@ -152,19 +181,63 @@ def remove_entity(eid):
 
     non-existent entity_ids will be silently ignored
 
+    If `postponed` is True, the entity is only put on the kill list and stays
+    fully functional until `reap_kill_list` is called.  `run_all_systems` and
+    `run_domain` do that after all systems have run, so entities that die
+    during a frame are torn down together at the end of it.
+
     """
+    if postponed:
+        kill_list[eid] = None
+        return
+
     # Ignore unknown eids, since we're removing anyways
     try:
         cids = eidx[eid].keys()
     except KeyError:
         return
 
-    remove_from_archetype(eid)
-
+    # remove_component drops eid from every archetype containing one of its
+    # cids.  Apart from the archetype without cids, these are the only
+    # archetypes eid can be registered with.
     remove_component(eid, *cids)
+    if () in archetype:
+        archetype[()].pop(eid, None)
     del eidx[eid]
 
 
+def reap_kill_list():
+    """Remove all entities that were removed with `postponed=True`
+
+        reap_kill_list() -> None
+
+    This is called automatically by `run_all_systems` and `run_domain`.  Call
+    it yourself if you're only using `run_system`.
+
+    Entities put on the kill list while reaping, e.g. by a `shutdown_` method
+    killing a child entity, are reaped as well.
+    """
+    while kill_list:
+        pending = list(kill_list)
+        kill_list.clear()
+        remove_entities(pending)
+
+
+def remove_entities(eids, postponed=False):
+    """Remove multiple entities from the system
+
+        remove_entities(eids, postponed=False) -> None
+
+    See `remove_entity`.  Duplicate eids are only removed once.
+    """
+    if postponed:
+        kill_list.update(dict.fromkeys(eids))
+        return
+
+    for eid in dict.fromkeys(eids):
+        remove_entity(eid)
+
+
 def add_component(eid, cid, comp):
     """Add a component to the registry.
 
@@ -204,9 +277,10 @@ def add_component(eid, cid, comp):
 
     cidx[cid][eid] = comp
     eidx[eid][cid] = comp
-    oidx[id(comp)] = eid
+    if track_comp_identity:
+        oidx[id(comp)] = eid
 
-    add_to_archetype(eid)
+    add_to_archetype(eid, cid)
 
     return cid
 
@@ -241,10 +315,11 @@ def remove_component(eid, *cids):
             obj = cidx[cid][eid]
             del cidx[cid][eid]
             del eidx[eid][cid]
-            del oidx[id(obj)]
         except KeyError:
             pass
         else:
+            # The same object can be registered multiple times, e.g. True
+            oidx.pop(id(obj), None)
             if hasattr(obj, 'shutdown_'):
                 obj.shutdown_()
 
@@ -372,13 +447,34 @@ def eids_by_cids(*cids):
 
         *cids		All component ids that need to match
 
+    If an archetype with the same cids in a different order exists, its
+    entities are returned with the components reordered.  Note that this is
+    only a lookup shortcut, archetypes are still stored separately per order.
     """
     res = []
     at = tuple(cids)
     if at in archetype:
         return comps_of_archetype(*cids)
 
-    for e, have_comps in eidx.items():
+    # An archetype with the same cids in a different order has the same
+    # entities, only the components need to be reordered.
+    for other in sigidx.get(frozenset(cids), ()):
+        if len(other) == len(at):
+            order = [other.index(c) for c in at]
+            return [(e, [comps[i] for i in order])
+                    for e, comps in archetype[other].items()]
+
+    if not cids:
+        return [(e, []) for e in eidx]
+
+    # Only entities having the rarest of the cids can match at all
+    try:
+        candidates = min((cidx[c] for c in cids), key=len)
+    except KeyError:
+        return res
+
+    for e in candidates:
+        have_comps = eidx[e]
         comps = []
         for c in cids:
             if c in have_comps:
@@ -401,10 +497,10 @@ def cids_of_eid(eid):
         ...
     Long description
     """
-    if eid not in eidx:
-        raise UnknownEntityError(f'Entity {eid} is not registered')
-
-    return list(eidx[eid].keys())
+    try:
+        return list(eidx[eid])
+    except KeyError as e:
+        raise UnknownEntityError(f'Entity {eid} is not registered') from e
 
 
 def comps_of_eid(eid, *cids):
@@ -420,14 +516,16 @@ def comps_of_eid(eid, *cids):
     While cids_of_eid gets component IDs, this function now gets the actual
     components containing the data.
     """
-    if eid not in eidx:
-        raise UnknownEntityError(f'Entity {eid} is not registered')
+    try:
+        have_comps = eidx[eid]
+    except KeyError as e:
+        raise UnknownEntityError(f'Entity {eid} is not registered') from e
 
     if not cids:
-        return eidx[eid].values()
+        return have_comps.values()
 
     try:
-        return [eidx[eid][cid] for cid in cids]
+        return [have_comps[cid] for cid in cids]
     except KeyError as e:
         raise UnknownComponentError(f'Component {e} not registered with entity {eid}') from e
 
@@ -448,7 +546,15 @@ def comp_of_eid(eid, cid):
 
     long description...
     """
-    return comps_of_eid(eid, cid)[0]
+    try:
+        have_comps = eidx[eid]
+    except KeyError as e:
+        raise UnknownEntityError(f'Entity {eid} is not registered') from e
+
+    try:
+        return have_comps[cid]
+    except KeyError as e:
+        raise UnknownComponentError(f'Component {e} not registered with entity {eid}') from e
 
 
 def eid_of_comp(comp):
@@ -463,8 +569,18 @@ def eid_of_comp(comp):
     Returns:
 
         entity
+
+    If `track_comp_identity` is disabled, this searches all entities.
     """
-    return oidx[id(comp)]
+    if track_comp_identity:
+        return oidx[id(comp)]
+
+    for eid, have_comps in eidx.items():
+        for c in have_comps.values():
+            if c is comp:
+                return eid
+
+    raise KeyError(id(comp))
 
 
 def cid_of_comp(eid, comp):
@@ -500,12 +616,13 @@ def cid_of_comp(eid, comp):
         If the passed component couldn't be found.
 
     """
-    if not has(eid):
-        raise UnknownEntityError(f'Entity {eid} is not registered')
+    try:
+        have_comps = eidx[eid]
+    except KeyError as e:
+        raise UnknownEntityError(f'Entity {eid} is not registered') from e
 
-    cids = cids_of_eid(eid)
-    for cid in cids:
-        if eidx[eid][cid] is comp:
+    for cid, c in have_comps.items():
+        if c is comp:
             return cid
 
     raise UnknownComponentError(f'Component {comp} not found in entity {eid}')
@@ -534,9 +651,61 @@ def run_system(dt, fkt, *cids, **kwargs):
         create_archetype(*cids)
 
     adict = archetype[at]
+    if not adict:
+        return {}
+
     # need to get call_list upfront, since kill_system could modify the dict
-    call_list = [(eid, *parms) for eid, parms in adict.items()]
-    return {eid: fkt(dt, eid, *parms, **kwargs) for eid, *parms in call_list}
+    call_list = list(adict.items())
+    return _call_system(dt, fkt, len(at), call_list, kwargs)
+
+
+def _call_system(dt, fkt, arity, call_list, kwargs):
+    # Unpacking *parms for every entity is a big part of a system's runtime,
+    # so the common arities without kwargs get their own loops.
+    if not kwargs:
+        match arity:
+            case 1:
+                return {eid: fkt(dt, eid, c0) for eid, (c0,) in call_list}
+            case 2:
+                return {eid: fkt(dt, eid, c0, c1) for eid, (c0, c1) in call_list}
+            case 3:
+                return {eid: fkt(dt, eid, c0, c1, c2) for eid, (c0, c1, c2) in call_list}
+            case 4:
+                return {eid: fkt(dt, eid, c0, c1, c2, c3) for eid, (c0, c1, c2, c3) in call_list}
+
+    return {eid: fkt(dt, eid, *parms, **kwargs) for eid, parms in call_list}
+
+
+def bind_system(fkt, *cids):
+    """Bind a system to its archetype for repeated runs
+
+        bind_system(fkt, *cids) -> runner
+
+    Arguments:
+
+        fkt     the actual system function
+        *cids   the components to run on
+
+    Returns a function `runner(dt, **kwargs)` that does the same as
+    `run_system(dt, fkt, *cids, **kwargs)`, but holds a direct reference to
+    the archetype, so the archetype doesn't need to be looked up again on
+    every call.
+
+    Note: After `reset` or `remove_archetype` for these cids, the runner still
+    works on the old archetype and needs to be bound again.
+    """
+    create_archetype(*cids)
+    adict = archetype[tuple(cids)]
+    arity = len(cids)
+
+    def runner(dt, **kwargs):
+        if not adict:
+            return {}
+
+        call_list = list(adict.items())
+        return _call_system(dt, fkt, arity, call_list, kwargs)
+
+    return runner
 
 
 def run_all_systems(dt):
@@ -550,9 +719,13 @@ def run_all_systems(dt):
 
     This calls above run_system for all registered systems with their
     appropriate components.
+
+    Entities removed with `postponed=True` are reaped after all systems ran.
     """
-    return {fkt: run_system(dt, fkt, *comps)
-            for fkt, comps in sidx.items()}
+    res = {fkt: run_system(dt, fkt, *comps)
+           for fkt, comps in sidx.items()}
+    reap_kill_list()
+    return res
 
 
 def run_domain(dt, domain):
@@ -569,8 +742,10 @@ def run_domain(dt, domain):
     if domain not in didx:
         return {}
 
-    return {fkt: run_system(dt, fkt, *sidx[fkt])
-            for fkt in didx[domain]}
+    res = {fkt: run_system(dt, fkt, *sidx[fkt])
+           for fkt in didx[domain]}
+    reap_kill_list()
+    return res
 
 
 def create_archetype(*cids):
@@ -612,27 +787,72 @@ def create_archetype(*cids):
         return
 
     archetype[at] = dict(eids_by_cids(*cids))
+    sig = signature[at] = frozenset(at)
+    if sig not in sigidx:
+        sigidx[sig] = set()
+    sigidx[sig].add(at)
+    for cid in at:
+        if cid not in aidx:
+            aidx[cid] = set()
+        aidx[cid].add(at)
 
 
 def remove_archetype(cids):
     """Remove an archetype from the system. (See `add_archetype`)"""
     at = tuple(cids)
     del archetype[at]
-
-
-def add_to_archetype(eid):
-    """Make sure, eid is registered with all appropriate archetypes."""
-    have_comps = set(cids_of_eid(eid))
-    for at in archetype:
-        s = set(at)
-        if s <= have_comps:
-            archetype[at][eid] = comps_of_eid(eid, *at)
+    # The signature holds every cid only once, even if at repeats it
+    sig = signature.pop(at)
+    sigidx[sig].discard(at)
+    if not sigidx[sig]:
+        del sigidx[sig]
+    for cid in sig:
+        aidx[cid].discard(at)
+        if not aidx[cid]:
+            del aidx[cid]
+
+
+def add_to_archetype(eid, cid=None):
+    """Make sure, eid is registered with all appropriate archetypes.
+
+    If `cid` is given, only the archetypes containing that cid (and the one
+    without any cids) are checked, since adding a single component cannot
+    affect any other archetype.
+    """
+    have_comps = eidx[eid]
+    have_cids = have_comps.keys()
+    if cid is None:
+        ats = archetype
+    else:
+        ats = aidx.get(cid, ())
+        # The archetype without cids matches every entity, but isn't listed
+        # in aidx.
+        if () in archetype:
+            ats = (*ats, ())
+
+    for at in ats:
+        if signature[at] <= have_cids:
+            adict = archetype[at]
+            row = adict.get(eid)
+            if row is None or cid is None:
+                adict[eid] = [have_comps[c] for c in at]
+            else:
+                # Replacing a component, only update it in the existing row.
+                # The cid can appear more than once in the archetype.
+                comp = have_comps[cid]
+                for i, c in enumerate(at):
+                    if c == cid:
+                        row[i] = comp
 
 
 def remove_from_archetype(eid, cid=None):
-    """Make sure, eid is only registered with appropriate archetypes."""
-    for at, adict in archetype.items():
-        if eid in adict and (cid is None or cid in at):
+    """Make sure, eid is only registered with appropriate archetypes.
+
+    If `cid` is given, only the archetypes containing that cid are checked.
+    """
+    for at in archetype if cid is None else aidx.get(cid, ()):
+        adict = archetype[at]
+        if eid in adict:
             del adict[eid]
 
 
@@ -665,4 +885,4 @@ def comps_of_archetype(*cids):
     if at not in archetype:
         raise UnknownArchetypeError
 
-    return [(e, comps) for e, comps in archetype[at].items()]
+    return list(archetype[at].items())
@@ -9,7 +9,11 @@ convenience.
 import pygame
 import tinyecs as ecs
 
-from pygame import Vector2
+from functools import lru_cache
+from itertools import product
+from pygame import Vector2, K_w, K_s, K_a, K_d
+from pygame.key import get_pressed as _get_pressed
+from pygame.mouse import get_pos as _get_mouse_pos
 
 __all__ = ["ESprite", "EVSprite", "RSAImage", "dead_system",
            "deadzone_system", "extension_system", "force_system",
@@ -74,9 +78,9 @@ class EVSprite(pygame.sprite.Sprite):
 
     Parameters
     ----------
-    image_factory: callable
-        A zero parameter function that is expected to return a
-        `pygame.surface.Surface` object.
+    image_factory: object
+        An object with an `image` attribute or property that provides a
+        `pygame.surface.Surface`, e.g. an `RSAImage`.
 
     *groups: *pygame.sprite.Group()
         Directly passed into parent class.  See `pygame.sprite.Sprite` for
@@ -95,20 +99,41 @@ class EVSprite(pygame.sprite.Sprite):
 
     @property
     def image(self):
-        new_image = self.image_factory.image
-        if new_image is self._image:
-            return self._image
-        else:
-            self._image = new_image
-            self.rect = self._image.get_rect(center=self.rect.center)
+        # Read per sprite per frame by group.draw, so keep the common
+        # "image unchanged" case as short as possible.
+        image = self.image_factory.image
+        if image is not self._image:
+            self._image = image
+            self.rect = image.get_rect(center=self.rect.center)
 
-        return self._image
+        return image
 
     @image.setter
     def image(self, image):
         raise RuntimeError('EVSprite.image is dynamically generated.')
 
 
+@lru_cache(maxsize=64)
+def _rs_image(image, rotate, scale):
+    """Create a rotated and scaled version of `image`.
+
+    This is the only image cache of this module.  It is shared by all
+    `RSAImage` instances and bounded, see `RSAImage.cache_clear` to release
+    it.  Don't modify the returned surface.
+    """
+    # Looks as if rotozoom is buggy and loses the surface flags, so
+    # until that is fixed, below block needs to be used instead of
+    # this:
+    # new_image = pygame.transform.rotozoom(image, rotate, scale)
+    #
+    if rotate != 0:
+        image = pygame.transform.rotate(image, rotate)
+    if scale != 1:
+        image = pygame.transform.smoothscale_by(image, scale)
+
+    return image
+
+
 class RSAImage:
     """A *R*otated, *S*caled and *A*lpha transparent image.
 
@@ -150,14 +175,31 @@ class RSAImage:
 
         To get/set the appropriate properties of the image
 
+    Methods
+    -------
+    set(*, rotate=None, scale=None, alpha=None)
+
+        Set multiple properties at once, creating the image only once.
+        Alternatively, set `locked` to True while changing them.
+
+    cache_clear()
+
+        Rotated and scaled images are kept in a small module level cache
+        shared by all instances.  Call this static method to release it,
+        e.g. when switching levels.
+
     Raises
     ------
     RuntimeError when the image property is written
 
     """
+    __slots__ = ('_base_image', '_image', 'image_factory', '_locked',
+                 '_rotate', '_scale', '_alpha', '_rs_key', '_rs_image')
+
     def __init__(self, image, rotate=0, scale=1, alpha=255, image_factory=None):
         self._base_image = self._image = image
         self.image_factory = image_factory
+        self._rs_key = self._rs_image = None
 
         self.locked = True
         self.rotate = rotate
@@ -180,39 +222,38 @@ class RSAImage:
         if not lck:
             self.update()
 
-    # @lru_cache(maxsize=1024)
     def _create(self, rotate, scale, alpha):
         if self.image_factory:
-            image = self.image_factory(rotate=int(self._rotate),
-                                       scale=round(self._scale, 2),
-                                       alpha=int(self._alpha))
-        else:
-            # Looks as if rotozoom is buggy and loses the surface flags, so
-            # until that is fixed, below block needs to be used instead of
-            # this:
-            # image = pygame.transform.rotozoom(self._base_image,
-            #                                   self._rotate,
-            #                                   self._scale)
-            #
-            if self._rotate != 0 and self._scale != 1:
-                image = pygame.transform.scale(
-                    pygame.transform.rotate(self._base_image, self._rotate),
-                    self._scale)
-            elif self._rotate != 0:
-                image = pygame.transform.rotate(self._base_image, self._rotate)
-            elif self._scale != 1:
-                image = pygame.transform.smoothscale(self._base_image, (self._scale, self._scale))
-            else:
-                image = self._base_image.copy()
-
-            image.set_alpha(self._alpha)
-        return image
+            return self.image_factory(rotate=rotate, scale=scale, alpha=alpha)
+
+        # Keep the rotated/scaled image of the last update, so changing only
+        # the alpha, e.g. for fading, doesn't need to resample it.
+        key = (rotate % 360, scale)
+        if key != self._rs_key:
+            self._rs_key = key
+            self._rs_image = _rs_image(self._base_image, *key)
+
+        new_image = self._rs_image.copy()
+        new_image.set_alpha(alpha)
+        return new_image
+
+    @staticmethod
+    def cache_clear():
+        _rs_image.cache_clear()
 
     def update(self):
-        # This needs to be called indirectly, with the parameter set, so
-        # lru_cache can do its thing.
         if not self.locked:
-            self._image = self._create(self.rotate, self.scale, self.alpha)
+            self._image = self._create(self._rotate, self._scale, self._alpha)
+
+    def set(self, *, rotate=None, scale=None, alpha=None):
+        """Change several of rotate, scale, alpha with only one image update."""
+        if rotate is not None:
+            self._rotate = rotate
+        if scale is not None:
+            self._scale = scale
+        if alpha is not None:
+            self._alpha = alpha
+        self.update()
 
     def __call__(self, *args, **kwargs):
         return self._image
@@ -250,8 +291,13 @@ class RSAImage:
 
 
 def dead_system(dt, eid, dead):
-    """Reap entities marked with a `dead` component."""
-    ecs.remove_entity(eid)
+    """Reap entities marked with a `dead` component.
+
+    The removal is postponed until `ecs.reap_kill_list`, which
+    `ecs.run_all_systems` and `ecs.run_domain` call after all systems.
+
+    """
+    ecs.remove_entity(eid, postponed=True)
 
 
 def deadzone_system(dt, eid, world, position, *, container):
@@ -304,15 +350,15 @@ def extension_system(dt, eid, extension):
         ]
 
     """
-    kill_list = []
+    pending = []
     for e in extension:
         (cooldown, cid, comp) = e
         if cooldown.cold():
             ecs.add_component(eid, cid, comp)
-            kill_list.append(e)
+        else:
+            pending.append(e)
 
-    for e in kill_list:
-        extension.remove(e)
+    extension[:] = pending
 
     if len(extension) == 0:
         ecs.remove_component(eid, 'extension')
@@ -324,9 +370,13 @@ def force_system(dt, eid, force, momentum):
 
 
 def lifetime_system(dt, eid, lifetime):
-    """Kill an entity after a specified time"""
+    """Kill an entity after a specified time
+
+    The removal is postponed, see `dead_system`.
+
+    """
     if lifetime.cold():
-        ecs.remove_entity(eid)
+        ecs.remove_entity(eid, postponed=True)
 
 
 def momentum_system(dt, eid, momentum, position):
@@ -336,8 +386,7 @@ def momentum_system(dt, eid, momentum, position):
 
 def mouse_system(dt, eid, mouse, position):
     """Place the position of an entity to the mouse cursor."""
-    mp = pygame.mouse.get_pos()
-    position.xy = Vector2(mp)
+    position.xy = _get_mouse_pos()
 
 
 def scale_system(dt, eid, scale, momentum):
@@ -356,12 +405,25 @@ friction_system = scale_system
 def sprite_system(dt, eid, sprite, position):
     """Set the rect.center of sprite to position."""
 
-    if sprite.rect:
-        sprite.rect.center = position
+    rect = sprite.rect
+    if rect is not None:
+        rect.center = position
     else:
         sprite.rect = sprite.image.get_rect(center=position)
 
 
+def _wsad_direction(w, s, a, d):
+    v = Vector2(d - a, s - w)
+    # Normalize so diagonals are not faster then axis motion
+    return v.normalize() if v else v
+
+
+# Direction vectors for all combinations of pressed w, s, a, d keys, so
+# wsad_system doesn't need to build and normalize one every frame.
+_WSAD_DIRECTIONS = {keys: _wsad_direction(*keys)
+                    for keys in product((False, True), repeat=4)}
+
+
 def wsad_system(dt, eid, wsad, position):
     """An example system to control a playear with the `wsad` keys.
 
@@ -385,15 +447,7 @@ def wsad_system(dt, eid, wsad, position):
         The position component to change according to the key presses.
 
     """
-    keys = pygame.key.get_pressed()
-
-    v = Vector2(0, 0)
+    keys = _get_pressed()
 
-    # Yes, I know, pep8...
-    if keys[pygame.K_w]: v.y -= 1
-    if keys[pygame.K_s]: v.y += 1
-    if keys[pygame.K_a]: v.x -= 1
-    if keys[pygame.K_d]: v.x += 1
-
-    # Normalize so diagonals are not faster then axis motion
-    if v: position += v.normalize() * wsad * dt
+    v = _WSAD_DIRECTIONS[keys[K_w], keys[K_s], keys[K_a], keys[K_d]]
+    if v: position += v * wsad * dt
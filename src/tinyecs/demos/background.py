@@ -11,6 +11,9 @@ def momentum_system(dt, eid, momentum, position):
 
 
 def border_system(dt, eid, border, position, momentum):
+    if position.x >= 0 and position.y >= 0 and border.collidepoint(position):
+        return
+
     if position.x < 0:
         position.x = -position.x
         momentum.x = -momentum.x
@@ -26,17 +29,19 @@ def border_system(dt, eid, border, position, momentum):
 
 
 def background_system(dt, eid, background, position, surface):
-    def draw_one(angle, offset):
-        v0 = Vector2(position)
-        v1 = Vector2(2000, 0).rotate(angle)
-        pygame.draw.line(surface, 'grey30', v0 + offset, v0 + v1 + offset, width=1)
-        pygame.draw.line(surface, 'grey30', v0 + offset, v0 - v1 + offset, width=1)
-
     angle = background.angle
+    # Same for all lines of this frame, so only compute once
+    v1 = Vector2(2000, 0).rotate(angle)
+
+    def draw_one(offset):
+        # One line through v0 instead of two lines starting at v0
+        v0 = position + offset
+        pygame.draw.line(surface, 'grey30', v0 - v1, v0 + v1, width=1)
+
     step = Vector2(250, 0).rotate(angle + 90)
     for i in range(10):
-        draw_one(angle, step * i)
-        draw_one(angle, -step * i)
+        draw_one(step * i)
+        draw_one(-step * i)
 
     background.angle = (background.angle + background.speed * dt) % 360
     pygame.draw.circle(surface, 'yellow', position, 3)
@@ -15,6 +15,9 @@ class Sprite(pygame.sprite.Sprite):
 
 
 def bounding_box_system(dt, eid, world, position, momentum):
+    if position.x >= 0 and position.y >= 0 and world.collidepoint(position):
+        return
+
     if position.x < 0:
         position.x = -position.x
         momentum.x = -momentum.x
@@ -29,24 +32,23 @@ def bounding_box_system(dt, eid, world, position, momentum):
         momentum.y = -momentum.y
 
 
-def create_thing(group, world):
-    pos = pygame.mouse.get_pos()
-
+def create_thing(group, world, pos):
     image = pygame.Surface((randint(5, 64), randint(5, 64)))
     image.fill(pygame.Color(randint(0, 255), randint(0, 255), randint(0, 255)))
 
-    entity = ecs.create_entity()
-    ecs.add_component(entity, 'sprite', Sprite(image, group))
-    ecs.add_component(entity, 'position', Vector2(pos))
     v = Vector2(random() * 150 + 150, 0)
     v.rotate_ip(random() * 360)
-    ecs.add_component(entity, 'momentum', v)
-    ecs.add_component(entity, 'container', world)
+
+    ecs.create_entity(components={'sprite': Sprite(image, group),
+                                  'position': Vector2(pos),
+                                  'momentum': v,
+                                  'container': world})
 
 
 def create_a_bunch(group, world):
+    pos = pygame.mouse.get_pos()
     for i in range(16):
-        create_thing(group, world)
+        create_thing(group, world, pos)
 
 
 def main():
@@ -59,7 +61,8 @@ def main():
     screen = pygame.display.set_mode(SCREEN.size)
     clock = pygame.time.Clock()
 
-    group = pygame.sprite.Group()
+    # Only redraw what the sprites covered, instead of the full screen
+    group = pygame.sprite.RenderUpdates()
 
     ecs.add_system(ecsc.momentum_system, 'momentum', 'position')
     ecs.add_system(ecsc.sprite_system, 'sprite', 'position')
@@ -70,6 +73,12 @@ def main():
     click = pygame.Font(None, 48).render('Click!', True, 'white')
     click_rect = click.get_rect(center=SCREEN.center)
 
+    background = pygame.Surface(SCREEN.size)
+    background.fill('black')
+    background.blit(click, click_rect)
+    screen.blit(background, (0, 0))
+    pygame.display.update()
+
     emit = False
     running = True
     while running:
@@ -94,15 +103,14 @@ def main():
         if emit:
             create_a_bunch(group, SCREEN)
 
-        screen.fill('black')
+        group.clear(screen, background)
 
         group.update(dt)
         ecs.run_all_systems(dt)
 
-        screen.blit(click, click_rect)
-        group.draw(screen)
+        dirty = group.draw(screen)
 
-        pygame.display.update()
+        pygame.display.update(dirty)
         clock.tick(FPS)
         runtime = pygame.time.get_ticks()/1000
         fps = clock.get_fps()
@@ -13,13 +13,13 @@ class Comps(Enum):
     PRINTABLE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     x: float
     y: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Velocity:
     dx: float
     dy: float
@@ -40,18 +40,20 @@ def lifetime_system(dt, eid, lifetime):
         ecs.remove_entity(eid)
 
 
-def render_system(dt, eid, printable):
+def render_system(dt, eid, printable, name, pos, velocity, lifetime):
     # the printable component contains no data at all and can be ignored,
     # but it will still be passed as a parameter.
-    name, pos, velocity, lifetime = ecs.comps_of_eid(eid,
-                                                     Comps.NAME,
-                                                     Comps.POSITION,
-                                                     Comps.VELOCITY,
-                                                     Comps.LIFETIME)
+    #
+    # The other components could also be fetched with ecs.comps_of_eid, but
+    # requesting them with the system lets the archetype hand them over
+    # directly instead of looking them up for every entity in every frame.
     print(f'{name} @ {pos.x, pos.y}, moving towards {velocity.dx, velocity.dy} '
           f'for {lifetime.time_left} seconds')
 
 
+RENDER_CIDS = (Comps.PRINTABLE, Comps.NAME, Comps.POSITION, Comps.VELOCITY, Comps.LIFETIME)
+
+
 def main():
     ten_seconds_walker = ecs.create_entity(tag='Walker')
     ecs.add_component(ten_seconds_walker, Comps.NAME, '10 Seconds Walker')
@@ -70,11 +72,11 @@ def main():
     print(f'All components: {ecs.cidx}')
     print(f'All systems: {ecs.sidx}')
 
-    ecs.run_system(1, render_system, Comps.PRINTABLE)
+    ecs.run_system(1, render_system, *RENDER_CIDS)
     for i in range(15):
         ecs.run_system(1, motion_system, Comps.POSITION, Comps.VELOCITY)
         ecs.run_system(1, lifetime_system, Comps.LIFETIME)
-        ecs.run_system(1, render_system, Comps.PRINTABLE)
+        ecs.run_system(1, render_system, *RENDER_CIDS)
 
     print(f'All entities: {ecs.eidx}')
     print(f'All components: {ecs.cidx}')
@@ -85,7 +87,7 @@ def main():
     print('*' * 72)
     ecs.add_system(motion_system, Comps.POSITION, Comps.VELOCITY)
     ecs.add_system(lifetime_system, Comps.LIFETIME)
-    ecs.add_system(render_system, Comps.PRINTABLE)
+    ecs.add_system(render_system, *RENDER_CIDS)
     ecs.add_system_to_domain('updates', motion_system)
     ecs.add_system_to_domain('updates', lifetime_system)
     ecs.add_system_to_domain('render', render_system)
@@ -2,23 +2,59 @@ import pygame
 import tinyecs as ecs
 import tinyecs.components as ecsc
 
-from math import copysign
+from dataclasses import dataclass
+from functools import cache
+from math import atan2, copysign, degrees
 from random import random
-from types import SimpleNamespace
 
 from pgcooldown import Cooldown
 from pygame import Vector2
 
 
-def dead_sprite_system(dt, eid, dead, sprite):
+@dataclass(slots=True)
+class HomingMissile:
+    target_pos: Vector2
+    allowed_angle: float = 180
+    prev_los: float | None = None
+
+
+# Dead shard sprites are kept here and recycled, since explosions create and
+# kill lots of them in short time.
+SPRITE_POOL_SIZE = 1024
+sprite_pool = []
+
+
+def acquire_sprite(image, pos, *groups):
+    if sprite_pool:
+        sprite = sprite_pool.pop()
+        sprite.add(*groups)
+        sprite.image = image
+        sprite.rect.size = image.get_size()
+        sprite.rect.center = pos
+    else:
+        sprite = pygame.sprite.Sprite(*groups)
+        sprite.image = image
+        sprite.rect = image.get_rect(center=pos)
+
+    return sprite
+
+
+def release_sprite(sprite):
     sprite.kill()
+    # Only shards are taken from the pool, so don't keep other sprites
+    if sprite.image is shard_image() and len(sprite_pool) < SPRITE_POOL_SIZE:
+        sprite_pool.append(sprite)
+
+
+def dead_sprite_system(dt, eid, dead, sprite):
+    release_sprite(sprite)
     ecs.remove_entity(eid)
 
 
 def lifetime_sprite_system(dt, eid, lifetime, sprite):
     if lifetime.hot():
         return
-    sprite.kill()
+    release_sprite(sprite)
     ecs.remove_entity(eid)
 
 
@@ -33,47 +69,63 @@ def homing_missile(target, pos, sprite_group):
     e = ecs.create_entity()
     ecs.add_component(e, 'position', Vector2(pos))
     ecs.add_component(e, 'sprite', sprite)
-    ecs.add_component(e, 'homing_missile', SimpleNamespace(target=target,
-                                                           allowed_angle=180,
-                                                           prev_los=None))
+    # All missiles chase the same target, so resolve its position vector once
+    # here instead of looking it up per missile in every frame.  Vector2 is
+    # mutable, so this reference follows the target.
+    ecs.add_component(e, 'homing_missile', HomingMissile(target_pos=ecs.comp_of_eid(target, 'position'),
+                                                         allowed_angle=180,
+                                                         prev_los=None))
     ecs.add_component(e, 'lifetime', Cooldown(20))
     ecs.add_component(e, 'momentum', momentum)
 
 
+@cache
+def shard_image():
+    # All shards of all explosions look the same, so they share one image.
+    image = pygame.Surface((3, 3))
+    image.fill('brown')
+    return image
+
+
 def create_shard(position, image, *groups):
     pos = Vector2(position)
     v = Vector2(random() * 250 + 50, 0).rotate(random() * 360)
-    sprite = pygame.sprite.Sprite(*groups)
-    sprite.image = image
-    sprite.rect = image.get_rect(center=pos)
+    sprite = acquire_sprite(image, pos, *groups)
 
-    e = ecs.create_entity()
-    ecs.add_component(e, 'position', pos)
-    ecs.add_component(e, 'sprite', sprite)
-    ecs.add_component(e, 'momentum', v)
-    ecs.add_component(e, 'lifetime', Cooldown(random() * 0.25))
+    ecs.create_entity(components={'position': pos,
+                                  'sprite': sprite,
+                                  'momentum': v,
+                                  'lifetime': Cooldown(random() * 0.25)})
 
 
-def homing_missile_system(dt, eid, homing_missile, position, momentum):
-    target_pos = ecs.comp_of_eid(homing_missile.target, 'position')
+def movement_system(dt, eid, momentum, position, sprite):
+    # momentum_system and sprite_system fused into one pass, every moving
+    # entity in this demo has a sprite.
+    position += momentum * dt
+    sprite.rect.center = position
 
-    target = target_pos
-    los = target - position
-    los_phi = (los.as_polar()[1] + 360) % 360 - 180
 
-    if los.length() < 16:
-        ecs.add_component(eid, 'dead', True)
+def mouse_system(dt, eid, mouse, position, sprite):
+    position.xy = pygame.mouse.get_pos()
+    sprite.rect.center = position
 
-        image = pygame.Surface((3, 3))
-        image.fill('brown')
 
-        parent = ecs.comp_of_eid(eid, 'sprite')
-        sprite_groups = parent.groups()
+def homing_missile_system(dt, eid, homing_missile, position, momentum):
+    los = homing_missile.target_pos - position
+
+    if los.length_squared() < 256:
+        ecs.add_component(eid, 'dead', True)
+
+        image = shard_image()
+        sprite_groups = ecs.comp_of_eid(eid, 'sprite').groups()
 
         for i in range(32):
             create_shard(position, image, *sprite_groups)
         return
 
+    # Same as los.as_polar()[1], without building the (r, phi) tuple
+    los_phi = (degrees(atan2(los.y, los.x)) + 360) % 360 - 180
+
     if homing_missile.prev_los is None:
         homing_missile.prev_los = los_phi
         return
@@ -96,6 +148,9 @@ def fire_system(dt, eid, fire, position):
 
 
 def bounding_box_system(dt, eid, world, position, momentum):
+    if position.x >= 0 and position.y >= 0 and world.collidepoint(position):
+        return
+
     if position.x < 0:
         position.x = -position.x
         momentum.x = -momentum.x
@@ -206,15 +261,15 @@ def main():
 
         screen.fill('black')
 
-        ecs.run_system(dt, ecsc.mouse_system, 'mouse', 'position')
+        ecs.run_system(dt, mouse_system, 'mouse', 'position', 'sprite')
         ecs.run_system(dt, lifetime_sprite_system, 'lifetime', 'sprite')
         ecs.run_system(dt, dead_sprite_system, 'dead', 'sprite')
         ecs.run_system(dt, ecsc.dead_system, 'dead')
-        ecs.run_system(dt, ecsc.momentum_system, 'momentum', 'position')
-        ecs.run_system(dt, ecsc.sprite_system, 'sprite', 'position')
+        ecs.run_system(dt, movement_system, 'momentum', 'position', 'sprite')
         ecs.run_system(dt, bounding_box_system, 'world', 'position', 'momentum')
         ecs.run_system(dt, homing_missile_system, 'homing_missile', 'position', 'momentum')
         ecs.run_system(dt, fire_system, 'fire', 'position')
+        ecs.reap_kill_list()
 
         screen.blit(click, click_rect)
         group.draw(screen)
@@ -3,16 +3,35 @@ import pygame
 import tinyecs as ecs
 
 from collections import deque
+from dataclasses import dataclass
 from random import random
-from types import SimpleNamespace
 
 from pgcooldown import Cooldown
 from pygame import Vector2
 
+# The marquee only walks the hue at full saturation and value, so look the
+# colors up instead of converting them every frame.
+HUE_COLORS = tuple(tuple(int(c * 255) for c in colorsys.hsv_to_rgb(h / 360, 1, 1))
+                   for h in range(360))
+
+
+@dataclass(slots=True)
+class Marquee:
+    v0: Vector2
+    v1: Vector2
+    speed0: Vector2
+    speed1: Vector2
+    deque: deque
+    delay: Cooldown
+    t: float = 0
+
 
 def marquee_system(dt, eid, marquee, border, surface):
     def bounce(point, momentum):
         point += momentum * dt
+        if point.x >= 0 and point.y >= 0 and border.collidepoint(point):
+            return
+
         if point.x < 0:
             point.x = -point.x
             momentum.x = -momentum.x
@@ -30,7 +49,7 @@ def marquee_system(dt, eid, marquee, border, surface):
     bounce(marquee.v1, marquee.speed1)
 
     marquee.t = (marquee.t + dt) % 1
-    color = [int(c * 255) for c in colorsys.hsv_to_rgb(marquee.t, 1, 1)]
+    color = HUE_COLORS[int(marquee.t * 360) % 360]
 
     if marquee.delay.cold():
         marquee.delay.reset()
@@ -56,13 +75,13 @@ def main():
     ecs.add_system('marquee', 'border', 'surface')
 
     e = ecs.create_entity()
-    ecs.add_component(e, 'marquee', SimpleNamespace(v0=Vector2(random() * SCREEN.width, random() * SCREEN.height),
-                                                    v1=Vector2(random() * SCREEN.width, random() * SCREEN.height),
-                                                    speed0=Vector2(random() * 50 + 100),
-                                                    speed1=Vector2(random() * 50 + 100),
-                                                    deque=deque(maxlen=16),
-                                                    delay=Cooldown(0.1),
-                                                    t=0))
+    ecs.add_component(e, 'marquee', Marquee(v0=Vector2(random() * SCREEN.width, random() * SCREEN.height),
+                                            v1=Vector2(random() * SCREEN.width, random() * SCREEN.height),
+                                            speed0=Vector2(random() * 50 + 100),
+                                            speed1=Vector2(random() * 50 + 100),
+                                            deque=deque(maxlen=16),
+                                            delay=Cooldown(0.1),
+                                            t=0))
     ecs.add_component(e, 'border', SCREEN)
     ecs.add_component(e, 'surface', screen)
 
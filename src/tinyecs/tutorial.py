@@ -95,15 +95,17 @@ here will always call this `eid`.  It's role is about the same as an object in
 game written in an object oriented style, e.g. a bonus coin.
 
 In contrast to OO development, the entity is really just an ID.  Calling
-`ecs.create_entity` will generate a random uuid4, but since entities are
-actually keys into a dict internally, any hashable type will work too.  It
-makes e.g. sense for the player entity to be quickly accessible by using
-'player' as ID.
+`ecs.create_entity` will generate a unique integer, but since entities are
+actually keys into a dict internally, you can pass any other hashable as tag
+instead.  It makes e.g. sense for the player entity to be quickly accessible
+by using 'player' as ID.  Better avoid ints as tags, since they can collide
+with generated IDs.  Creating an entity with a tag that is already registered
+removes the old entity first.
 
 Entities are created and removed with
 
 ```py
-eid = ecs.create_entity()  # gives you a uuid4 ID
+eid = ecs.create_entity()  # gives you a unique int ID
 player = ecs.create_entity('player')  # gives you 'player' as ID
 
 ecs.remove_entity(eid)
@@ -307,6 +309,8 @@ pygame.quit()
 from random import random, choice
 from pygame.colordict import THECOLORS
 
+COLORS = tuple(THECOLORS)
+
 class DemoSprite(pygame.sprite.Sprite):
     def __init__(self, *groups):
         # Make sure, the sprite is properly initialized for sprite groups
@@ -317,7 +321,7 @@ class DemoSprite(pygame.sprite.Sprite):
 
         # Just set up a basic pygame sprite instance
         self.image = pygame.Surface((w, h))
-        self.image.fill(choice(list(THECOLORS)))
+        self.image.fill(choice(COLORS))
 
         # Note that we don't set the position!
         self.rect = self.image.get_rect()
@@ -398,8 +402,9 @@ The lines marked with `>` are additions to the game loop template all above.
                     running = False
 
 >       if emitting: 
+>           pos = pygame.mouse.get_pos()
 >           for _ in range(10):
->               create_box_entity(pygame.mouse.get_pos())
+>               create_box_entity(pos)
 
         screen.fill('black')
 ```
@@ -445,6 +450,10 @@ DT_MAX = 3 / FPS
 # addition.
 WORLD = SCREEN.scale_by(1.25)
 
+# Picking from a tuple is much cheaper than building a list of all color
+# names for every sprite.
+COLORS = tuple(THECOLORS)
+
 
 class DemoSprite(pygame.sprite.Sprite):
     def __init__(self, *groups):
@@ -456,7 +465,7 @@ class DemoSprite(pygame.sprite.Sprite):
 
         # Just set up a basic pygame sprite instance
         self.image = pygame.Surface((w, h))
-        self.image.fill(choice(list(THECOLORS)))
+        self.image.fill(choice(COLORS))
 
         # Note that we don't set the position!
         self.rect = self.image.get_rect()
@@ -519,8 +528,9 @@ while running:
                 running = False
 
     if emitting:
+        pos = pygame.mouse.get_pos()
         for _ in range(10):
-            create_box_entity(pygame.mouse.get_pos(), group)
+            create_box_entity(pos, group)
 
     ecs.run_system(dt, momentum_system, 'momentum', 'position')
     ecs.run_system(dt, deadzone_system, 'position', world=WORLD)
@@ -579,6 +589,10 @@ import tinyecs.compsys as ecsc
     Instead, you can add a component tagged e.g. 'dead', and later reap all
     entities marked with that tag.
 
+    The entities are removed with `postponed=True`, so they are only torn down
+    by `ecs.reap_kill_list()`.  `run_all_systems` and `run_domain` do that for
+    you, when using `run_system` directly, call it at the end of your frame.
+
 `def deadzone_system(dt, eid, world, position, *, container)`:
 
     Basically the function created in this tutorial, with one addition.
@@ -601,7 +615,8 @@ import tinyecs.compsys as ecsc
 
 `def lifetime_system(dt, eid, lifetime)`:
     Kills the entity once lifetime has run out.  Expects `lifetime` to be an
-    instance of `pgcooldown.Cooldown`
+    instance of `pgcooldown.Cooldown`.  Like `dead_system`, the removal is
+    postponed.
 
 `def momentum_system(dt, eid, momentum, position)`:
     The same as we wrote in the tutorial above.
@@ -646,6 +661,10 @@ DT_MAX = 3 / FPS
 # addition.
 WORLD = SCREEN.scale_by(1.25)
 
+# Picking from a tuple is much cheaper than building a list of all color
+# names for every sprite.
+COLORS = tuple(THECOLORS)
+
 
 class DemoSprite(pygame.sprite.Sprite):
     """Just a class that provides a basic image and the shutdown_ method"""
@@ -658,7 +677,7 @@ class DemoSprite(pygame.sprite.Sprite):
 
         # Just set up a basic pygame sprite instance
         self.image = pygame.Surface((w, h))
-        self.image.fill(choice(list(THECOLORS)))
+        self.image.fill(choice(COLORS))
 
         # Note that we don't set the position!
         self.rect = self.image.get_rect()
@@ -723,8 +742,9 @@ def main():
                     running = False
 
         if emitting:
+            pos = pygame.mouse.get_pos()
             for _ in range(10):
-                create_box_entity(pygame.mouse.get_pos(), group)
+                create_box_entity(pos, group)
 
         ecs.run_system(dt, momentum_system, 'momentum', 'position')
         ecs.run_system(dt, deadzone_system, 'position', world=WORLD)
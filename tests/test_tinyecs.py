@@ -1,5 +1,4 @@
 import pytest
-import re
 
 import tinyecs as ecs
 
@@ -50,9 +49,6 @@ def move_system(dt, eid, pos, velocity):
     return (pos.x, pos.y)
 
 
-UUID_RE = re.compile('^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
-
-
 def setup():
     ecs.reset()
     ecs.add_system(ping_system, 'ping')
@@ -63,17 +59,31 @@ def setup():
                               {'name': SimpleNamespace(name='Ipsum'), 'health': Health()}))
 
 
-def re_helper(s, re):
-    match = re.fullmatch(s)
-    return match
-
-
 def test_entity_creation():
     e1, e2 = setup()
-    assert re_helper(str(e1), UUID_RE), "Name doesn't match uuid format"
+    assert isinstance(e1, int), "Generated eid is not an int"
     assert e2 == 'player', "Name is not 'player'"
 
 
+def test_generated_eids_are_unique():
+    ecs.reset()
+    e1 = ecs.create_entity()
+    ecs.create_entity(e1 + 1)
+    e3 = ecs.create_entity()
+    assert e3 not in (e1, e1 + 1)
+    assert len(ecs.eidx) == 3
+
+    # Re-creating a registered eid replaces the old entity cleanly
+    ecs.add_component(e1, 'x', 'first')
+    assert ecs.create_entity(e1) == e1
+    assert ecs.eidx[e1] == {}
+    assert e1 not in ecs.cidx['x']
+    assert ecs.healthcheck()
+
+    # 0 is a valid tag
+    assert ecs.create_entity(0) == 0
+
+
 def test_add_component():
     e1, e2 = setup()
     ecs.add_component(e1, 'pos', SimpleNamespace(x=100, y=200))
@@ -128,6 +138,21 @@ def test_eids_by_cids():
     assert 'not registered with entity' in str(e.value)
 
 
+def test_eids_by_cids_reordered_archetype():
+    e1, e2 = setup()
+    assert ('health', 'name') not in ecs.archetype
+
+    res = ecs.eids_by_cids('health', 'name')
+    assert len(res) == 1
+    assert res[0][0] == e2
+    assert type(res[0][1][0]) is Health
+    assert res[0][1][1].name == 'Ipsum'
+
+    assert ecs.sigidx[frozenset(('name', 'health'))] == {('name', 'health')}
+    ecs.remove_archetype(('name', 'health'))
+    assert frozenset(('name', 'health')) not in ecs.sigidx
+
+
 def test_cids_of_eid():
     assert set(ecs.cids_of_eid('player')) == set(['name', 'health'])
 
@@ -153,6 +178,49 @@ def test_run_system():
     assert ecs.cidx['health'][e2].health == 900
 
 
+def test_run_system_arities():
+    ecs.reset()
+    cids = 'abcde'
+    e = ecs.create_entity(components={cid: cid for cid in cids})
+
+    def collect(dt, eid, *comps, sep=''):
+        return sep.join(comps)
+
+    for n in range(len(cids) + 1):
+        assert ecs.run_system(1, collect, *cids[:n]) == {e: cids[:n]}
+        assert ecs.run_system(1, collect, *cids[:n], sep='-') == {e: '-'.join(cids[:n])}
+
+
+def test_run_system_without_cids():
+    ecs.reset()
+
+    def eid_system(dt, eid):
+        return eid
+
+    e1 = ecs.create_entity(components={'a': 1})
+    assert ecs.run_system(1, eid_system) == {e1: e1}
+
+    # Entities getting components later are picked up too
+    e2 = ecs.create_entity(components={'b': 2})
+    assert ecs.run_system(1, eid_system) == {e1: e1, e2: e2}
+
+    ecs.remove_entity(e1)
+    assert ecs.run_system(1, eid_system) == {e2: e2}
+    assert e1 not in ecs.archetype[()]
+
+
+def test_bind_system():
+    e1, e2 = setup()
+    runner = ecs.bind_system(wounding_system, 'health')
+
+    res = runner(1)
+    assert res == {e2: 900}
+
+    e3 = ecs.create_entity(components={'health': Health()})
+    res = runner(1)
+    assert res == {e2: 800, e3: 900}
+
+
 def test_run_all_systems():
     e1, e2 = setup()
     ecs.add_system(move_system, 'pos', 'velocity')
@@ -187,7 +255,7 @@ def test_remove_entity():
     ecs.remove_entity(e1)
     assert e1 not in ecs.eidx
     for c in ecs.cidx:
-        assert e1 not in c
+        assert e1 not in ecs.cidx[c]
 
     for c in comps:
         assert id(c) not in ecs.oidx
@@ -216,6 +284,18 @@ def test_eid_of_comp():
 
     ecs.remove_entity(e)
 
+    ecs.track_comp_identity = False
+    try:
+        e = ecs.create_entity()
+        ecs.add_component(e, 'test', c)
+        assert id(c) not in ecs.oidx
+        assert ecs.eid_of_comp(c) == e
+        ecs.remove_entity(e)
+        with pytest.raises(KeyError):
+            ecs.eid_of_comp(c)
+    finally:
+        ecs.track_comp_identity = True
+
 
 def test_reset():
     ecs.reset()
@@ -243,6 +323,59 @@ def test_kill_from_system():
     assert len(ecs.eidx) == 5
 
 
+def test_postponed_remove_entity():
+    def kill_system(dt, eid, kill):
+        ecs.remove_entity(eid, postponed=True)
+
+    ecs.reset()
+    ecs.add_system(kill_system, 'kill')
+    for i in range(10):
+        e = ecs.create_entity()
+        ecs.add_component(e, 'kill', True)
+
+    ecs.run_system(1, kill_system, 'kill')
+    assert len(ecs.eidx) == 10
+    assert len(ecs.kill_list) == 10
+
+    # Killing them again before the reap doesn't queue them twice
+    ecs.run_system(1, kill_system, 'kill')
+    assert len(ecs.kill_list) == 10
+
+    ecs.reap_kill_list()
+    assert len(ecs.eidx) == 0
+    assert len(ecs.kill_list) == 0
+
+    e = ecs.create_entity()
+    ecs.add_component(e, 'kill', True)
+    ecs.run_all_systems(1)
+    assert e not in ecs.eidx
+
+    # Entities killed while reaping are reaped too
+    child = ecs.create_entity()
+    parent = ecs.create_entity(components={
+        'child': SimpleNamespace(shutdown_=lambda: ecs.remove_entity(child, postponed=True))})
+    ecs.remove_entity(parent, postponed=True)
+    ecs.reap_kill_list()
+    assert parent not in ecs.eidx
+    assert child not in ecs.eidx
+    assert len(ecs.kill_list) == 0
+
+
+def test_remove_entities():
+    e1, e2 = setup()
+    e3 = ecs.create_entity()
+    ecs.remove_entities([e1, e2, e1, 'xyzzy'])
+    assert e1 not in ecs.eidx
+    assert e2 not in ecs.eidx
+    assert e3 in ecs.eidx
+    assert e2 not in ecs.archetype[('name', 'health')]
+
+    ecs.remove_entities([e3], postponed=True)
+    assert e3 in ecs.eidx
+    ecs.reap_kill_list()
+    assert e3 not in ecs.eidx
+
+
 def test_add_system_to_domain():
     setup()
     ecs.add_system(ping_system, 'ping')
@@ -389,6 +522,43 @@ def test_add_to_archetype():
     ecs.remove_component(e, 'test')
     assert e not in ecs.archetype[('test',)]
 
+    # Replacing a component updates the existing archetype row
+    e1, e2 = setup()
+    row = ecs.archetype[('name', 'health')][e2]
+    ecs.update_component(e2, 'health', Health(500))
+    assert ecs.archetype[('name', 'health')][e2] is row
+    assert row[1].health == 500
+
+    # ... in every slot of a cid that appears more than once
+    e = ecs.create_entity(components={'a': 1})
+    ecs.create_archetype('a', 'a')
+    ecs.update_component(e, 'a', 2)
+    assert ecs.archetype[('a', 'a')][e] == [2, 2]
+
+
+def test_archetype_index():
+    setup()
+
+    assert ('name', 'health') in ecs.aidx['name']
+    assert ('name', 'health') in ecs.aidx['health']
+
+    e = ecs.create_entity()
+    ecs.add_component(e, 'name', SimpleNamespace(name='Dolor'))
+    assert e not in ecs.archetype[('name', 'health')]
+
+    ecs.add_component(e, 'health', Health())
+    assert e in ecs.archetype[('name', 'health')]
+
+    ecs.remove_component(e, 'name')
+    assert e not in ecs.archetype[('name', 'health')]
+
+    ecs.remove_archetype(('name', 'health'))
+    assert 'name' not in ecs.aidx
+
+    ecs.create_archetype('a', 'a')
+    ecs.remove_archetype(('a', 'a'))
+    assert 'a' not in ecs.aidx
+
 
 def test_comps_of_archetype():
     e1, e2 = setup()
@@ -402,13 +572,18 @@ def test_comps_of_archetype():
 
 if __name__ == '__main__':
     test_entity_creation()
+    test_generated_eids_are_unique()
     test_add_component()
     test_remove_component()
     test_add_system()
     test_eids_by_cids()
+    test_eids_by_cids_reordered_archetype()
     test_cids_of_eid()
     test_comps_of_eid()
     test_run_system()
+    test_run_system_arities()
+    test_run_system_without_cids()
+    test_bind_system()
     test_run_all_systems()
     test_remove_system()
     test_remove_entity()
@@ -416,6 +591,8 @@ if __name__ == '__main__':
     test_eid_of_comp()
     test_reset()
     test_kill_from_system()
+    test_postponed_remove_entity()
+    test_remove_entities()
     test_add_system_to_domain()
     test_remove_system_from_domain()
     test_run_domain()
@@ -425,4 +602,5 @@ if __name__ == '__main__':
     test_healthcheck()
     test_create_archetype()
     test_add_to_archetype()
+    test_archetype_index()
     test_comps_of_archetype()